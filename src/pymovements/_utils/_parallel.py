@@ -0,0 +1,168 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides helpers for mapping functions over independent work items in parallel."""
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable
+from collections.abc import Sequence
+from concurrent.futures import as_completed
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from tqdm.auto import tqdm
+
+
+EXECUTORS = ('thread', 'process')
+
+
+def _create_executor(executor: str, num_workers: int) -> Executor:
+    """Create an executor with the given number of workers.
+
+    Process pools use the ``spawn`` start method, as forking a process after polars has started
+    its thread pool can deadlock the child processes.
+    """
+    if executor == 'process':
+        return ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return ThreadPoolExecutor(max_workers=num_workers)
+
+
+def check_parallel_arguments(num_workers: int, executor: str) -> None:
+    """Check if the parallel execution arguments are valid.
+
+    Parameters
+    ----------
+    num_workers: int
+        Number of workers. Must be a positive integer.
+    executor: str
+        Name of the executor. Must be one of ``'thread'`` or ``'process'``.
+
+    Raises
+    ------
+    TypeError
+        If ``num_workers`` is not an integer.
+    ValueError
+        If ``num_workers`` is not positive or ``executor`` is not supported.
+    """
+    if isinstance(num_workers, bool) or not isinstance(num_workers, int):
+        raise TypeError(
+            f'num_workers must be of type int but is of type {type(num_workers).__name__}',
+        )
+    if num_workers < 1:
+        raise ValueError(f'num_workers must be positive but is {num_workers}')
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Executor '{executor}' not supported. "
+            f'Please choose one of the following: {list(EXECUTORS)}',
+        )
+
+
+def parallel_map(
+        function: Callable[..., Any],
+        kwargs_list: Sequence[dict[str, Any]],
+        *,
+        num_workers: int = 1,
+        executor: str = 'thread',
+        labels: Sequence[str] | None = None,
+        disable_progressbar: bool = False,
+) -> list[Any]:
+    """Call a function for each item of a list of keyword arguments.
+
+    The results are returned in the order of ``kwargs_list``, regardless of the order in which
+    the workers finish.
+
+    With ``num_workers=1`` all calls are made serially in the calling process and any exception
+    is propagated unchanged. Otherwise, the calls are distributed across a thread or process pool.
+    All items are processed even if some of them fail. The failures are then reported together,
+    each with the label of its item.
+
+    Parameters
+    ----------
+    function: Callable[..., Any]
+        Function to call. Must be picklable if ``executor='process'``, i.e. defined at module
+        level.
+    kwargs_list: Sequence[dict[str, Any]]
+        Keyword arguments for each call.
+    num_workers: int
+        Number of workers. (default: 1)
+    executor: str
+        Use ``'thread'`` for a thread pool or ``'process'`` for a process pool. Threads avoid
+        pickling overhead and work well where the work is done in polars or I/O that releases the
+        GIL. Processes avoid the GIL entirely but need all arguments and results to be picklable.
+        (default: 'thread')
+    labels: Sequence[str] | None
+        Labels of the items used in error messages. If ``None``, the item index is used.
+        (default: None)
+    disable_progressbar: bool
+        If ``True``, no progress bar is shown. (default: False)
+
+    Returns
+    -------
+    list[Any]
+        The return values in the order of ``kwargs_list``.
+
+    Raises
+    ------
+    RuntimeError
+        If any of the calls failed during parallel execution. The exception of the first failed
+        item is chained as the cause.
+    """
+    check_parallel_arguments(num_workers=num_workers, executor=executor)
+
+    if labels is None:
+        labels = [str(index) for index in range(len(kwargs_list))]
+
+    if num_workers == 1 or len(kwargs_list) <= 1:
+        return [
+            function(**kwargs)
+            for kwargs in tqdm(kwargs_list, disable=disable_progressbar)
+        ]
+
+    results: list[Any] = [None] * len(kwargs_list)
+    errors: dict[int, BaseException] = {}
+
+    with _create_executor(executor, num_workers) as pool:
+        futures = {
+            pool.submit(function, **kwargs): index
+            for index, kwargs in enumerate(kwargs_list)
+        }
+        for future in tqdm(as_completed(futures), total=len(futures), disable=disable_progressbar):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                errors[index] = exception
+
+    if errors:
+        failed_indices = sorted(errors)
+        error_lines = '\n'.join(
+            f'  {labels[index]}: {type(errors[index]).__name__}: {errors[index]}'
+            for index in failed_indices
+        )
+        raise RuntimeError(
+            f'{len(errors)} of {len(kwargs_list)} items failed:\n{error_lines}',
+        ) from errors[failed_indices[0]]
+
+    return results
@@ -104,6 +104,8 @@ class Dataset:
             events_dirname: str | None = None,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            num_workers: int = 1,
+            executor: str = 'thread',
     ) -> Dataset:
         """Parse file information and load all gaze files.
 
@@ -135,6 +137,12 @@ class Dataset:
             Specifies the file format for loading data. Valid options are: `csv`, `feather`,
             `tsv`, `txt`, `asc`.
             (default: 'feather')
+        num_workers: int
+            Number of workers used to load files in parallel. Files are loaded serially if set
+            to 1. (default: 1)
+        executor: str
+            Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+            process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
         Returns
         -------
@@ -149,21 +157,25 @@ class Dataset:
                 preprocessed=preprocessed,
                 preprocessed_dirname=preprocessed_dirname,
                 extension=extension,
+                num_workers=num_workers,
+                executor=executor,
             )
 
         # Event files precomuted by authors of the dataset
         if self.definition.has_files['precomputed_events']:
-            self.load_precomputed_events()
+            self.load_precomputed_events(num_workers=num_workers, executor=executor)
 
         # Reading measures files precomuted by authors of the dataset
         if self.definition.has_files['precomputed_reading_measures']:
-            self.load_precomputed_reading_measures()
+            self.load_precomputed_reading_measures(num_workers=num_workers, executor=executor)
 
         # Events detected previously by pymovements
         if events:
             self.load_event_files(
                 events_dirname=events_dirname,
                 extension=extension,
+                num_workers=num_workers,
+                executor=executor,
             )
             for loaded_gaze_df, loaded_events_df in zip(self.gaze, self.events):
                 loaded_gaze_df.events = loaded_events_df
@@ -193,6 +205,9 @@ class Dataset:
             preprocessed: bool = False,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            *,
+            num_workers: int = 1,
+            executor: str = 'thread',
     ) -> Dataset:
         """Load all available gaze data files.
 
@@ -210,6 +225,12 @@ class Dataset:
             Specifies the file format for loading data. Valid options are: `csv`, `feather`,
             `tsv`, `txt`, `asc`.
             (default: 'feather')
+        num_workers: int
+            Number of workers used to load files in parallel. Files are loaded serially if set
+            to 1. (default: 1)
+        executor: str
+            Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+            process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
         Returns
         -------
@@ -221,7 +242,8 @@ class Dataset:
         AttributeError
             If `fileinfo` is None or the `fileinfo` dataframe is empty.
         RuntimeError
-            If file type of gaze file is not supported.
+            If file type of gaze file is not supported or if loading any of the files failed
+            during parallel loading.
         """
         self._check_fileinfo()
         self.gaze = dataset_files.load_gaze_files(
@@ -231,26 +253,57 @@ class Dataset:
             preprocessed=preprocessed,
             preprocessed_dirname=preprocessed_dirname,
             extension=extension,
+            num_workers=num_workers,
+            executor=executor,
         )
 
         return self
 
-    def load_precomputed_events(self) -> None:
-        """Load precomputed events."""
+    def load_precomputed_events(self, *, num_workers: int = 1, executor: str = 'thread') -> None:
+        """Load precomputed events.
+
+        Parameters
+        ----------
+        num_workers: int
+            Number of workers used to load files in parallel. Files are loaded serially if set
+            to 1. (default: 1)
+        executor: str
+            Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+            process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
+        """
         self._check_fileinfo()
         self.precomputed_events = dataset_files.load_precomputed_event_files(
             self.definition,
             self.fileinfo['precomputed_events'],
             self.paths,
+            num_workers=num_workers,
+            executor=executor,
         )
 
-    def load_precomputed_reading_measures(self) -> None:
-        """Load precomputed events."""
+    def load_precomputed_reading_measures(
+            self,
+            *,
+            num_workers: int = 1,
+            executor: str = 'thread',
+    ) -> None:
+        """Load precomputed events.
+
+        Parameters
+        ----------
+        num_workers: int
+            Number of workers used to load files in parallel. Files are loaded serially if set
+            to 1. (default: 1)
+        executor: str
+            Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+            process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
+        """
         self._check_fileinfo()
         self.precomputed_reading_measures = dataset_files.load_precomputed_reading_measures(
             self.definition,
             self.fileinfo['precomputed_reading_measures'],
             self.paths,
+            num_workers=num_workers,
+            executor=executor,
         )
 
     def split_gaze_data(
@@ -299,6 +352,9 @@ class Dataset:
             self,
             events_dirname: str | None = None,
             extension: str = 'feather',
+            *,
+            num_workers: int = 1,
+            executor: str = 'thread',
     ) -> Dataset:
         """Load all available event files.
 
@@ -312,6 +368,12 @@ class Dataset:
         extension: str
             Specifies the file format for loading data. Valid options are: `csv`, `feather`.
             (default: 'feather')
+        num_workers: int
+            Number of workers used to load files in parallel. Files are loaded serially if set
+            to 1. (default: 1)
+        executor: str
+            Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+            process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
         Returns
         -------
@@ -324,6 +386,8 @@ class Dataset:
             If `fileinfo` is None or the `fileinfo` dataframe is empty.
         ValueError
             If extension is not in list of valid extensions.
+        RuntimeError
+            If loading any of the files failed during parallel loading.
         """
         self._check_fileinfo()
         self.events = dataset_files.load_event_files(
@@ -332,6 +396,8 @@ class Dataset:
             paths=self.paths,
             events_dirname=events_dirname,
             extension=extension,
+            num_workers=num_workers,
+            executor=executor,
         )
         return self
 
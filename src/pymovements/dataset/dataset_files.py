@@ -28,6 +28,7 @@ from typing import Any
 import polars as pl
 from tqdm.auto import tqdm
 
+from pymovements._utils._parallel import parallel_map
 from pymovements._utils._paths import match_filepaths
 from pymovements._utils._strings import curly_to_regex
 from pymovements.dataset.dataset_definition import DatasetDefinition
@@ -131,6 +132,9 @@ def load_event_files(
         paths: DatasetPaths,
         events_dirname: str | None = None,
         extension: str = 'feather',
+        *,
+        num_workers: int = 1,
+        executor: str = 'thread',
 ) -> list[EventDataFrame]:
     """Load all event files according to fileinfo dataframe.
 
@@ -150,11 +154,17 @@ def load_event_files(
         Specifies the file format for loading data. Valid options are: `csv`, `feather`,
         `tsv`, `txt`.
         (default: 'feather')
+    num_workers: int
+        Number of workers used to load files in parallel. Files are loaded serially if set to 1.
+        (default: 1)
+    executor: str
+        Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+        process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
     Returns
     -------
     list[EventDataFrame]
-        List of event dataframes.
+        List of event dataframes in the order of the fileinfo dataframe.
 
     Raises
     ------
@@ -162,41 +172,87 @@ def load_event_files(
         If `fileinfo` is None or the `fileinfo` dataframe is empty.
     ValueError
         If extension is not in list of valid extensions.
+    RuntimeError
+        If loading any of the files failed during parallel loading. The error message lists each
+        failed file.
     """
-    event_dfs: list[EventDataFrame] = []
-
-    # read and preprocess input files
-    for fileinfo_row in tqdm(fileinfo.to_dicts()):
-        filepath = Path(fileinfo_row['filepath'])
-        filepath = paths.raw / filepath
-
-        filepath = paths.raw_to_event_filepath(
-            filepath,
+    fileinfo_rows = fileinfo.to_dicts()
+    filepaths = [
+        paths.raw_to_event_filepath(
+            paths.raw / Path(fileinfo_row['filepath']),
             events_dirname=events_dirname,
             extension=extension,
         )
+        for fileinfo_row in fileinfo_rows
+    ]
 
-        if extension == 'feather':
-            event_df = pl.read_ipc(filepath)
-        elif extension in {'csv', 'tsv', 'txt'}:
-            event_df = pl.read_csv(filepath)
-        else:
-            valid_extensions = ['csv', 'txt', 'tsv', 'feather']
-            raise ValueError(
-                f'unsupported file format "{extension}".'
-                f'Supported formats are: {valid_extensions}',
-            )
+    return parallel_map(
+        load_event_file,
+        [
+            {
+                'filepath': filepath,
+                'fileinfo_row': fileinfo_row,
+                'definition': definition,
+                'extension': extension,
+            }
+            for filepath, fileinfo_row in zip(filepaths, fileinfo_rows)
+        ],
+        num_workers=num_workers,
+        executor=executor,
+        labels=[str(filepath) for filepath in filepaths],
+    )
 
-        # Add fileinfo columns to dataframe.
-        event_df = add_fileinfo(
-            definition=definition,
-            df=event_df,
-            fileinfo=fileinfo_row,
+
+def load_event_file(
+        filepath: Path,
+        fileinfo_row: dict[str, Any],
+        definition: DatasetDefinition,
+        extension: str = 'feather',
+) -> EventDataFrame:
+    """Load an event file as EventDataFrame.
+
+    Parameters
+    ----------
+    filepath: Path
+        Path of event file.
+    fileinfo_row: dict[str, Any]
+        A dictionary holding file information.
+    definition: DatasetDefinition
+        The dataset definition.
+    extension: str
+        Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+        `tsv`, `txt`.
+        (default: 'feather')
+
+    Returns
+    -------
+    EventDataFrame
+        The resulting EventDataFrame.
+
+    Raises
+    ------
+    ValueError
+        If extension is not in list of valid extensions.
+    """
+    if extension == 'feather':
+        event_df = pl.read_ipc(filepath)
+    elif extension in {'csv', 'tsv', 'txt'}:
+        event_df = pl.read_csv(filepath)
+    else:
+        valid_extensions = ['csv', 'txt', 'tsv', 'feather']
+        raise ValueError(
+            f'unsupported file format "{extension}".'
+            f'Supported formats are: {valid_extensions}',
         )
 
-        event_dfs.append(EventDataFrame(event_df))
+    # Add fileinfo columns to dataframe.
+    event_df = add_fileinfo(
+        definition=definition,
+        df=event_df,
+        fileinfo=fileinfo_row,
+    )
 
-    return event_dfs
+    return EventDataFrame(event_df)
 
 
 def load_gaze_files(
@@ -206,6 +262,9 @@ def load_gaze_files(
         preprocessed: bool = False,
         preprocessed_dirname: str | None = None,
         extension: str = 'feather',
+        *,
+        num_workers: int = 1,
+        executor: str = 'thread',
 ) -> list[GazeDataFrame]:
     """Load all available gaze data files.
 
@@ -229,23 +288,30 @@ def load_gaze_files(
         Specifies the file format for loading data. Valid options are: `csv`, `feather`,
         `txt`, `tsv`.
         (default: 'feather')
+    num_workers: int
+        Number of workers used to load files in parallel. Files are loaded serially if set to 1.
+        (default: 1)
+    executor: str
+        Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+        process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
     Returns
     -------
     list[GazeDataFrame]
-        Returns self, useful for method cascading.
+        List of gaze dataframes in the order of the fileinfo dataframe.
 
     Raises
     ------
     AttributeError
         If `fileinfo` is None or the `fileinfo` dataframe is empty.
     RuntimeError
-        If file type of gaze file is not supported.
+        If file type of gaze file is not supported or if loading any of the files failed during
+        parallel loading.
     """
-    gaze_dfs: list[GazeDataFrame] = []
+    fileinfo_rows = fileinfo.to_dicts()
 
-    # Read gaze files from fileinfo attribute.
-    for fileinfo_row in tqdm(fileinfo.to_dicts()):
+    filepaths = []
+    for fileinfo_row in fileinfo_rows:
         filepath = Path(fileinfo_row['filepath'])
         filepath = paths.raw / filepath
 
@@ -254,16 +320,23 @@ def load_gaze_files(
                 filepath, preprocessed_dirname=preprocessed_dirname,
                 extension=extension,
             )
+        filepaths.append(filepath)
 
-        gaze_df = load_gaze_file(
-            filepath=filepath,
-            fileinfo_row=fileinfo_row,
-            definition=deepcopy(definition),
-            preprocessed=preprocessed,
-        )
-        gaze_dfs.append(gaze_df)
-
-    return gaze_dfs
+    return parallel_map(
+        load_gaze_file,
+        [
+            {
+                'filepath': filepath,
+                'fileinfo_row': fileinfo_row,
+                'definition': deepcopy(definition),
+                'preprocessed': preprocessed,
+            }
+            for filepath, fileinfo_row in zip(filepaths, fileinfo_rows)
+        ],
+        num_workers=num_workers,
+        executor=executor,
+        labels=[str(filepath) for filepath in filepaths],
+    )
 
 
 def load_gaze_file(
@@ -375,6 +448,9 @@ def load_precomputed_reading_measures(
         definition: DatasetDefinition,
         fileinfo: pl.DataFrame,
         paths: DatasetPaths,
+        *,
+        num_workers: int = 1,
+        executor: str = 'thread',
 ) -> list[ReadingMeasures]:
     """Load text stimulus from file.
 
@@ -386,22 +462,38 @@ def load_precomputed_reading_measures(
         Information about the files.
     paths: DatasetPaths
         Adjustable paths to extract datasets.
+    num_workers: int
+        Number of workers used to load files in parallel. Files are loaded serially if set to 1.
+        (default: 1)
+    executor: str
+        Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+        process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
     Returns
     -------
     list[ReadingMeasures]
         Return list of precomputed event dataframes.
     """
-    precomputed_reading_measures = []
-    for filepath in fileinfo.to_dicts():
-        data_path = paths.precomputed_reading_measures / Path(filepath['filepath'])
-        precomputed_reading_measures.append(
-            load_precomputed_reading_measure_file(
-                data_path,
-                definition.custom_read_kwargs['precomputed_reading_measures'],
-            ),
-        )
-    return precomputed_reading_measures
+    data_paths = [
+        paths.precomputed_reading_measures / Path(fileinfo_row['filepath'])
+        for fileinfo_row in fileinfo.to_dicts()
+    ]
+    return parallel_map(
+        load_precomputed_reading_measure_file,
+        [
+            {
+                'data_path': data_path,
+                'custom_read_kwargs': definition.custom_read_kwargs[
+                    'precomputed_reading_measures'
+                ],
+            }
+            for data_path in data_paths
+        ],
+        num_workers=num_workers,
+        executor=executor,
+        labels=[str(data_path) for data_path in data_paths],
+        disable_progressbar=True,
+    )
 
 
 def load_precomputed_reading_measure_file(
@@ -442,6 +534,9 @@ def load_precomputed_event_files(
         definition: DatasetDefinition,
         fileinfo: pl.DataFrame,
         paths: DatasetPaths,
+        *,
+        num_workers: int = 1,
+        executor: str = 'thread',
 ) -> list[PrecomputedEventDataFrame]:
     """Load text stimulus from file.
 
@@ -453,22 +548,36 @@ def load_precomputed_event_files(
         Information about the files.
     paths: DatasetPaths
         Adjustable paths to extract datasets.
+    num_workers: int
+        Number of workers used to load files in parallel. Files are loaded serially if set to 1.
+        (default: 1)
+    executor: str
+        Use ``'thread'`` to load files in a thread pool or ``'process'`` to load files in a
+        process pool. Only used if ``num_workers`` is greater than 1. (default: 'thread')
 
     Returns
     -------
     list[PrecomputedEventDataFrame]
         Return list of precomputed event dataframes.
     """
-    precomputed_events = []
-    for filepath in fileinfo.to_dicts():
-        data_path = paths.precomputed_events / Path(filepath['filepath'])
-        precomputed_events.append(
-            load_precomputed_event_file(
-                data_path,
-                definition.custom_read_kwargs['precomputed_events'],
-            ),
-        )
-    return precomputed_events
+    data_paths = [
+        paths.precomputed_events / Path(fileinfo_row['filepath'])
+        for fileinfo_row in fileinfo.to_dicts()
+    ]
+    return parallel_map(
+        load_precomputed_event_file,
+        [
+            {
+                'data_path': data_path,
+                'custom_read_kwargs': definition.custom_read_kwargs['precomputed_events'],
+            }
+            for data_path in data_paths
+        ],
+        num_workers=num_workers,
+        executor=executor,
+        labels=[str(data_path) for data_path in data_paths],
+        disable_progressbar=True,
+    )
 
 
 def load_precomputed_event_file(
@@ -24,6 +24,7 @@ from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
+import numpy as np
 import polars as pl
 
 import pymovements as pm  # pylint: disable=cyclic-import
@@ -131,6 +132,8 @@ class EventGazeProcessor:
             gaze: pm.GazeDataFrame,
             identifiers: str | list[str],
             name: str | None = None,
+            *,
+            engine: str = 'join',
     ) -> pl.DataFrame:
         """Process event and gaze dataframe.
 
@@ -144,6 +147,12 @@ class EventGazeProcessor:
             Column names to join on events and gaze dataframes.
         name: str | None
             Process only events that match the name. (default: None)
+        engine: str
+            The engine used for computing the event properties. Supported engines are ``join`` and
+            ``loop``. The ``join`` engine assigns all gaze samples to their events in a single
+            interval join and computes the properties of all events in a single ``group_by``
+            aggregation. The ``loop`` engine filters the gaze samples separately for each event
+            and is kept as a reference implementation. (default: 'join')
 
         Returns
         -------
@@ -154,7 +163,7 @@ class EventGazeProcessor:
         Raises
         ------
         ValueError
-            If list of identifiers is empty.
+            If list of identifiers is empty or if ``engine`` is not supported.
         InvalidProperty
             If ``property_name`` is not a valid property. See
             :py:mod:`pymovements.events` for an overview of supported properties.
@@ -169,6 +178,12 @@ class EventGazeProcessor:
         if len(trial_identifiers) == 0:
             raise ValueError('list of identifiers must not be empty')
 
+        if engine not in {'join', 'loop'}:
+            raise ValueError(
+                f"Engine '{engine}' not supported. "
+                "Please choose one of the following: ['join', 'loop'].",
+            )
+
         property_expressions: list[Callable[..., pl.Expr]] = [
             EVENT_PROPERTIES[property_name] for property_name, _ in self.event_properties
         ]
@@ -189,6 +204,21 @@ class EventGazeProcessor:
             if len(events_frame) == 0:
                 raise RuntimeError(f'No events with name "{name}" found in data frame')
 
+        # Without any events there is nothing to join, the loop returns an empty result right away.
+        if engine == 'join' and len(events_frame) > 0:
+            property_expressions_with_kwargs = [
+                this_property_expression(**this_property_kwargs).alias(this_property_name)
+                for this_property_name, this_property_expression, this_property_kwargs,
+                in zip(property_names, property_expressions, property_kwargs)
+            ]
+            property_frame = _aggregate_event_samples(
+                events_frame=events_frame,
+                gaze_frame=gaze.frame,
+                trial_identifiers=trial_identifiers,
+                expressions=property_expressions_with_kwargs,
+            )
+            return events_frame.select(event_identifiers).hstack(property_frame)
+
         property_values = defaultdict(list)
         for event in events_frame.iter_rows(named=True):
             # Find gaze samples that belong to the current event.
@@ -216,6 +246,137 @@ class EventGazeProcessor:
         return result
 
 
+def _aggregate_event_samples(
+        events_frame: pl.DataFrame,
+        gaze_frame: pl.DataFrame,
+        trial_identifiers: list[str],
+        expressions: list[pl.Expr],
+) -> pl.DataFrame:
+    """Aggregate the gaze samples of each event in a single ``group_by`` query.
+
+    Each gaze sample is assigned to all events of the same trial whose time window
+    ``[onset, offset]`` contains the sample timestamp. The timestamps of each trial are sorted
+    once and the event onsets and offsets are looked up by binary search, which avoids filtering
+    the whole gaze dataframe for every single event.
+
+    Parameters
+    ----------
+    events_frame: pl.DataFrame
+        The events to aggregate the gaze samples for.
+    gaze_frame: pl.DataFrame
+        The gaze samples.
+    trial_identifiers: list[str]
+        Column names to join on events and gaze dataframes.
+    expressions: list[pl.Expr]
+        The aggregation expressions to evaluate on the gaze samples of each event.
+
+    Returns
+    -------
+    pl.DataFrame
+        A dataframe with one column for each expression and one row for each event in
+        ``events_frame``. Events without any gaze samples have null values.
+    """
+    event_indices, sample_indices = _assign_samples_to_events(
+        events_frame=events_frame,
+        gaze_frame=gaze_frame,
+        trial_identifiers=trial_identifiers,
+    )
+
+    # Expressions that are no aggregations (e.g. ``head()``) would produce lists in a group_by
+    # context. Take their first value instead, just like ``item()`` does for a single event.
+    gaze_schema = gaze_frame.lazy().select(expressions).collect_schema()
+    aggregation_schema = gaze_frame.lazy().group_by(pl.lit(0)).agg(expressions).collect_schema()
+    expressions = [
+        expression if aggregation_schema[name] == gaze_schema[name] else expression.first()
+        for expression, name in zip(expressions, gaze_schema.names())
+    ]
+
+    event_samples = gaze_frame[sample_indices].with_columns(
+        pl.Series('__event_index__', event_indices, dtype=pl.UInt32),
+    )
+    aggregated = event_samples.group_by('__event_index__').agg(expressions)
+
+    all_event_indices = pl.DataFrame(
+        {'__event_index__': np.arange(len(events_frame))},
+        schema={'__event_index__': pl.UInt32},
+    )
+    return (
+        all_event_indices
+        .join(aggregated, on='__event_index__', how='left', maintain_order='left')
+        .drop('__event_index__')
+    )
+
+
+def _assign_samples_to_events(
+        events_frame: pl.DataFrame,
+        gaze_frame: pl.DataFrame,
+        trial_identifiers: list[str],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Assign gaze samples to events by trial identifiers and time.
+
+    Parameters
+    ----------
+    events_frame: pl.DataFrame
+        The events with ``onset`` and ``offset`` columns.
+    gaze_frame: pl.DataFrame
+        The gaze samples with a ``time`` column.
+    trial_identifiers: list[str]
+        Column names to join on events and gaze dataframes.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Row indices of events and row indices of the gaze samples belonging to the respective
+        event. Pairs are sorted by event index first and sample index second, i.e. the gaze
+        samples of each event keep their original order.
+    """
+    gaze_partitions = (
+        gaze_frame
+        .select(*trial_identifiers, 'time')
+        .with_row_index('__sample_index__')
+        .drop_nulls()
+        .partition_by(trial_identifiers, as_dict=True, include_key=False)
+    )
+    event_partitions = (
+        events_frame
+        .select(*trial_identifiers, 'onset', 'offset')
+        .with_row_index('__event_index__')
+        .drop_nulls()
+        .partition_by(trial_identifiers, as_dict=True, include_key=False)
+    )
+
+    event_indices: list[np.ndarray] = []
+    sample_indices: list[np.ndarray] = []
+    for trial, trial_events in event_partitions.items():
+        if trial not in gaze_partitions:
+            continue
+        trial_gaze = gaze_partitions[trial]
+
+        timestamps = trial_gaze['time'].to_numpy()
+        order = np.argsort(timestamps, kind='stable')
+        sorted_timestamps = timestamps[order]
+        trial_sample_indices = trial_gaze['__sample_index__'].to_numpy()[order]
+
+        starts = np.searchsorted(sorted_timestamps, trial_events['onset'].to_numpy(), side='left')
+        ends = np.searchsorted(sorted_timestamps, trial_events['offset'].to_numpy(), side='right')
+        lengths = np.maximum(ends - starts, 0)
+
+        # Enumerate the sample positions [start, end) of all events at once.
+        run_offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = run_offsets + np.arange(lengths.sum())
+
+        event_indices.append(np.repeat(trial_events['__event_index__'].to_numpy(), lengths))
+        sample_indices.append(trial_sample_indices[positions])
+
+    if not event_indices:
+        return np.array([], dtype=np.uint32), np.array([], dtype=np.uint32)
+
+    event_index_array = np.concatenate(event_indices)
+    sample_index_array = np.concatenate(sample_indices)
+    pair_order = np.lexsort((sample_index_array, event_index_array))
+    return event_index_array[pair_order], sample_index_array[pair_order]
+
+
 def _check_event_properties(
         event_properties: str | tuple[str, dict[str, Any]] | list[str]
         | list[str | tuple[str, dict[str, Any]]],
@@ -175,8 +175,8 @@ def disposition(
     y_position = pl.col(position_column).list.get(1)
 
     return (
-        (x_position.head(n=1) - x_position.reverse().head(n=1)).pow(2)
-        + (y_position.head(n=1) - y_position.reverse().head(n=1)).pow(2)
+        (x_position.first() - x_position.last()).pow(2)
+        + (y_position.first() - y_position.last()).pow(2)
     ).sqrt()
 
 
@@ -257,8 +257,7 @@ def location(
 
         component_expressions.append(expression_component)
 
-    # Not sure why first() is needed here, but an outer list is being created somehow.
-    return pl.concat_list(component_expressions).first()
+    return pl.concat_list(component_expressions)
 
 
 @register_event_property
@@ -22,9 +22,11 @@ from __future__ import annotations
 
 import calendar
 import datetime
+import io
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +42,9 @@ EYE_TRACKING_SAMPLE = re.compile(
     r'(?P<dots>[A-Za-z.]{3,5})?\s*',
 )
 
+# Anchored pattern for parsing blocks of sample lines in bulk with polars.
+EYE_TRACKING_SAMPLE_PATTERN = '^' + EYE_TRACKING_SAMPLE.pattern
+
 EYELINK_META_REGEXES = [
     {'pattern': re.compile(regex)} for regex in (
         r'\*\*\s+VERSION:\s+(?P<version_1>.*)\s+',
@@ -83,6 +88,10 @@ BLINK_STOP_REGEX = re.compile(
     r'(?P<timestamp_end>(\d+[.]?\d*))\s+(?P<duration_ms>(\d+[.]?\d*))\s*',
 )
 
+# First tokens of lines that can match the event regexes above.
+EVENT_START_TOKENS = ('SFIX', 'SSACC', 'SBLINK')
+EVENT_END_TOKENS = ('EFIX', 'ESACC', 'EBLINK')
+
 CALIBRATION_TIMESTAMP_REGEX = re.compile(r'MSG\s+(?P<timestamp>\d+[.]?\d*)\s+!CAL\s*\n')
 
 CALIBRATION_REGEX = re.compile(
@@ -221,6 +230,7 @@ def parse_eyelink(
         schema: dict[str, Any] | None = None,
         metadata_patterns: list[dict[str, Any] | str] | None = None,
         encoding: str | None = None,
+        chunk_size: int | None = None,
 ) -> tuple[pl.DataFrame, pl.DataFrame, dict[str, Any]]:
     """Parse EyeLink asc file.
 
@@ -236,6 +246,11 @@ def parse_eyelink(
         list of patterns to match for additional metadata. (default: None)
     encoding: str | None
         Text encoding of the file. If None, the locale encoding is used. (default: None)
+    chunk_size: int | None
+        If specified, the file is streamed in chunks of ``chunk_size`` characters (i.e. bytes for
+        ASCII encoded files) instead of being read into memory at once. The samples of each chunk
+        are parsed and converted to a gaze dataframe chunk right away, which keeps the peak
+        memory usage bounded by the chunk size. (default: None)
 
     Returns
     -------
@@ -254,7 +269,7 @@ def parse_eyelink(
     For 1000 Hz recordings, durations calculated by pymovements are 1 ms shorter than the durations
     reported in the asc file.
     """
-    # pylint: disable=too-many-branches, too-many-statements
+    # pylint: disable=too-many-branches, too-many-nested-blocks, too-many-statements
     if patterns is None:
         patterns = []
     compiled_patterns = compile_patterns(patterns)
@@ -271,13 +286,7 @@ def parse_eyelink(
         'fixation': {}, 'saccade': {}, 'blink': {},
     }
 
-    samples: dict[str, list[Any]] = {
-        'time': [],
-        'x_pix': [],
-        'y_pix': [],
-        'pupil': [],
-        **{additional_column: [] for additional_column in additional_columns},
-    }
+    gaze_chunks: list[pl.DataFrame] = []
     events: dict[str, list[Any]] = {
         'name': [],
         'onset': [],
@@ -285,9 +294,6 @@ def parse_eyelink(
         **{additional_column: [] for additional_column in additional_columns},
     }
 
-    with open(filepath, encoding=encoding) as asc_file:
-        lines = asc_file.readlines()
-
     # will return an empty string if the key does not exist
     metadata: defaultdict = defaultdict(str)
 
@@ -310,114 +316,126 @@ def parse_eyelink(
     num_blink_samples = 0
     blinking = False
 
-    for line in lines:
-        for pattern_dict in compiled_patterns:
-
-            if match := pattern_dict['pattern'].match(line):
-                if 'value' in pattern_dict:
-                    current_column = pattern_dict['column']
-                    current_additional[current_column] = pattern_dict['value']
-
-                else:
-                    current_additional.update(match.groupdict())
-
-        if cal_timestamp:
-            # if a calibration timestamp has been found, the next line will be a
-            # calibration pattern, if not, there will only be the timestamp added to the overview
-
-            # very ugly pylint solution
-            calibrations.append(
-                {
-                    'timestamp': cal_timestamp,
-                    **match.groupdict(),
-                }
-                if (match := CALIBRATION_REGEX.match(line))
-                else {'timestamp': cal_timestamp},
-            )
-            cal_timestamp = ''
-
-        elif event_name := parse_eyelink_event_start(line):
-            current_event_additional[event_name] = {**current_additional}
-
-            if event_name == 'blink':
-                blinking = True
-
-        elif event := parse_eyelink_event_end(line):
-            event_name, event_onset, event_offset = event
-            events['name'].append(f'{event_name}_eyelink')
-            events['onset'].append(event_onset)
-            events['offset'].append(event_offset)
-
-            for additional_column in additional_columns:
-                events[additional_column].append(
-                    current_event_additional[event_name][additional_column],
-                )
-            current_event_additional[event_name] = {}
-
-            if event_name == 'blink':
-                sample_length = 1 / float(recording_config[-1]['sampling_rate']) * 1000
-                num_blink_samples += round((event_offset - event_onset) / sample_length) + 1
-                blinking = False
-
-        elif match := RECORDING_CONFIG_REGEX.match(line):
-            recording_config.append(match.groupdict())
-
-        elif match := RESOLUTION_REGEX.match(line):
-            left, top, right, bottom = (float(coord) for coord in match.group('resolution').split())
-            # GAZE_COORDS is always logged after RECCFG -> add it to the last recording_config
-            recording_config[-1]['resolution'] = (right - left + 1, bottom - top + 1)
-
-        elif match := START_RECORDING_REGEX.match(line):
-            start_recording_timestamp = match.groupdict()['timestamp']
-
-        elif match := STOP_RECORDING_REGEX.match(line):
-            stop_recording_timestamp = match.groupdict()['timestamp']
-            block_duration = float(stop_recording_timestamp) - float(start_recording_timestamp)
-            total_recording_duration += block_duration
-            num_expected_samples += round(
-                block_duration * float(recording_config[-1]['sampling_rate']) / 1000,
-            )
-
-        elif eye_tracking_sample_match := EYE_TRACKING_SAMPLE.match(line):
-
-            timestamp_s = eye_tracking_sample_match.group('time')
-            x_pix_s = eye_tracking_sample_match.group('x_pix')
-            y_pix_s = eye_tracking_sample_match.group('y_pix')
-            pupil_s = eye_tracking_sample_match.group('pupil')
-
-            timestamp = float(timestamp_s)
-            x_pix = check_nan(x_pix_s)
-            y_pix = check_nan(y_pix_s)
-            pupil = check_nan(pupil_s)
+    for lines in _read_lines_in_chunks(filepath, encoding=encoding, chunk_size=chunk_size):
+        sample_lines: list[str] = []
+        sample_runs: list[tuple[int, dict[str, Any], bool]] = []
+        run_start = 0
+
+        for line in lines:
+            # Sample lines are the vast majority of lines and start with a digit. They are only
+            # collected here and parsed in bulk for the whole chunk. The additional column values
+            # and the blink state can only change in between runs of consecutive sample lines.
+            # The line following a calibration timestamp needs to be checked by the full chain.
+            if line[:1].isdigit() and not cal_timestamp:
+                sample_lines.append(line)
+                continue
 
-            samples['time'].append(timestamp)
-            samples['x_pix'].append(x_pix)
-            samples['y_pix'].append(y_pix)
-            samples['pupil'].append(pupil)
+            if len(sample_lines) > run_start:
+                sample_runs.append(
+                    (len(sample_lines) - run_start, {**current_additional}, blinking),
+                )
+                run_start = len(sample_lines)
+
+            # All patterns for additional columns are prefixed with MSG.
+            if line.startswith('MSG'):
+                for pattern_dict in compiled_patterns:
+
+                    if match := pattern_dict['pattern'].match(line):
+                        if 'value' in pattern_dict:
+                            current_column = pattern_dict['column']
+                            current_additional[current_column] = pattern_dict['value']
+
+                        else:
+                            current_additional.update(match.groupdict())
+
+            if cal_timestamp:
+                # if a calibration timestamp has been found, the next line will be a
+                # calibration pattern, if not, there will only be the timestamp added to the
+                # overview
+
+                # very ugly pylint solution
+                calibrations.append(
+                    {
+                        'timestamp': cal_timestamp,
+                        **match.groupdict(),
+                    }
+                    if (match := CALIBRATION_REGEX.match(line))
+                    else {'timestamp': cal_timestamp},
+                )
+                cal_timestamp = ''
+
+            elif line.startswith(EVENT_START_TOKENS) and (
+                event_name := parse_eyelink_event_start(line)
+            ):
+                current_event_additional[event_name] = {**current_additional}
+
+                if event_name == 'blink':
+                    blinking = True
+
+            elif line.startswith(EVENT_END_TOKENS) and (event := parse_eyelink_event_end(line)):
+                event_name, event_onset, event_offset = event
+                events['name'].append(f'{event_name}_eyelink')
+                events['onset'].append(event_onset)
+                events['offset'].append(event_offset)
+
+                for additional_column in additional_columns:
+                    events[additional_column].append(
+                        current_event_additional[event_name][additional_column],
+                    )
+                current_event_additional[event_name] = {}
+
+                if event_name == 'blink':
+                    sample_length = 1 / float(recording_config[-1]['sampling_rate']) * 1000
+                    num_blink_samples += round((event_offset - event_onset) / sample_length) + 1
+                    blinking = False
+
+            elif match := RECORDING_CONFIG_REGEX.match(line):
+                recording_config.append(match.groupdict())
+
+            elif match := RESOLUTION_REGEX.match(line):
+                left, top, right, bottom = (
+                    float(coord) for coord in match.group('resolution').split()
+                )
+                # GAZE_COORDS is always logged after RECCFG -> add it to the last recording_config
+                recording_config[-1]['resolution'] = (right - left + 1, bottom - top + 1)
+
+            elif match := START_RECORDING_REGEX.match(line):
+                start_recording_timestamp = match.groupdict()['timestamp']
+
+            elif match := STOP_RECORDING_REGEX.match(line):
+                stop_recording_timestamp = match.groupdict()['timestamp']
+                block_duration = float(stop_recording_timestamp) - float(start_recording_timestamp)
+                total_recording_duration += block_duration
+                num_expected_samples += round(
+                    block_duration * float(recording_config[-1]['sampling_rate']) / 1000,
+                )
 
-            for additional_column in additional_columns:
-                samples[additional_column].append(current_additional[additional_column])
+            elif match := CALIBRATION_TIMESTAMP_REGEX.match(line):
+                cal_timestamp = match.groupdict()['timestamp']
 
-            if not blinking and x_pix is not np.nan and y_pix is not np.nan and pupil is not np.nan:
-                num_valid_samples += 1
+            elif match := VALIDATION_REGEX.match(line):
+                validations.append(match.groupdict())
 
-        elif match := CALIBRATION_TIMESTAMP_REGEX.match(line):
-            cal_timestamp = match.groupdict()['timestamp']
+            elif compiled_metadata_patterns:
+                for pattern_dict in compiled_metadata_patterns.copy():
+                    if match := pattern_dict['pattern'].match(line):
+                        if 'value' in pattern_dict:
+                            metadata[pattern_dict['key']] = pattern_dict['value']
 
-        elif match := VALIDATION_REGEX.match(line):
-            validations.append(match.groupdict())
+                        else:
+                            metadata.update(match.groupdict())
 
-        elif compiled_metadata_patterns:
-            for pattern_dict in compiled_metadata_patterns.copy():
-                if match := pattern_dict['pattern'].match(line):
-                    if 'value' in pattern_dict:
-                        metadata[pattern_dict['key']] = pattern_dict['value']
+                        # each metadata pattern should only match once
+                        compiled_metadata_patterns.remove(pattern_dict)
 
-                    else:
-                        metadata.update(match.groupdict())
+        if len(sample_lines) > run_start:
+            sample_runs.append((len(sample_lines) - run_start, {**current_additional}, blinking))
 
-                    # each metadata pattern should only match once
-                    compiled_metadata_patterns.remove(pattern_dict)
+        gaze_chunk, num_valid_chunk_samples = _parse_eyelink_sample_lines(
+            sample_lines, sample_runs, additional_columns,
+        )
+        gaze_chunks.append(gaze_chunk)
+        num_valid_samples += num_valid_chunk_samples
 
     if not metadata:
         warnings.warn('No metadata found. Please check the file for errors.')
@@ -454,12 +472,127 @@ def parse_eyelink(
     if schema is not None:
         event_schema_overrides.update(schema)
 
-    gaze_df = pl.from_dict(data=samples).cast(gaze_schema_overrides)
+    if not gaze_chunks:  # the file is empty
+        gaze_chunks.append(_parse_eyelink_sample_lines([], [], additional_columns)[0])
+
+    gaze_df = pl.concat(gaze_chunks, how='vertical_relaxed').cast(gaze_schema_overrides)
     event_df = pl.from_dict(data=events).cast(event_schema_overrides)
 
     return gaze_df, event_df, pre_processed_metadata
 
 
+def _parse_eyelink_sample_lines(
+        sample_lines: list[str],
+        sample_runs: list[tuple[int, dict[str, Any], bool]],
+        additional_columns: set[str],
+) -> tuple[pl.DataFrame, int]:
+    """Parse sample lines in bulk.
+
+    Lines that do not match :py:data:`EYE_TRACKING_SAMPLE` are skipped. Position and pupil values
+    that cannot be parsed as floats (e.g. ``.`` during blinks) are set to ``np.nan``.
+
+    Parameters
+    ----------
+    sample_lines: list[str]
+        Lines starting with a digit.
+    sample_runs: list[tuple[int, dict[str, Any], bool]]
+        Runs of consecutive sample lines. Each run consists of the number of lines, the values of
+        the additional columns and whether the samples are recorded during a blink.
+    additional_columns: set[str]
+        Names of the additional columns parsed by patterns.
+
+    Returns
+    -------
+    tuple[pl.DataFrame, int]
+        The parsed samples and the number of valid samples, excluding samples during blinks.
+    """
+    # The sample fields are the first four whitespace separated tokens of matching lines.
+    fields = (
+        pl.Series('line', sample_lines, dtype=pl.String)
+        .to_frame()
+        .select(
+            pl.col('line').str.contains(EYE_TRACKING_SAMPLE_PATTERN).alias('is_sample'),
+            pl.col('line').str.replace_all(r'\s+', ' ').str.split_exact(' ', 3)
+            .struct.rename_fields(['time', 'x_pix', 'y_pix', 'pupil']),
+        )
+        .unnest('line')
+    )
+
+    runs = pl.DataFrame(
+        {
+            **{
+                column: [run_additional[column] for _, run_additional, _ in sample_runs]
+                for column in additional_columns
+            },
+            'blinking': [run_blinking for _, _, run_blinking in sample_runs],
+        },
+        schema_overrides={'blinking': pl.Boolean},
+    )
+    run_lengths = [run_length for run_length, _, _ in sample_runs]
+    run_indices = np.repeat(np.arange(len(sample_runs)), run_lengths)
+
+    samples = (
+        pl.concat([fields, runs[run_indices]], how='horizontal')
+        .filter(pl.col('is_sample'))
+        .with_columns(
+            pl.col('time').cast(pl.Float64),
+            pl.col('x_pix', 'y_pix', 'pupil').cast(pl.Float64, strict=False),
+        )
+    )
+
+    num_valid_samples = samples.select(
+        (
+            ~pl.col('blinking')
+            & pl.all_horizontal(pl.col('x_pix', 'y_pix', 'pupil').is_not_null())
+        ).sum(),
+    ).item()
+
+    samples = samples.select(
+        'time',
+        pl.col('x_pix', 'y_pix', 'pupil').fill_null(np.nan),
+        *additional_columns,
+    )
+    return samples, num_valid_samples
+
+
+def _read_lines_in_chunks(
+        filepath: Path | str,
+        encoding: str | None = None,
+        chunk_size: int | None = None,
+) -> Iterator[list[str]]:
+    """Read the lines of a text file in chunks.
+
+    Parameters
+    ----------
+    filepath: Path | str
+        Path of the file to read.
+    encoding: str | None
+        Text encoding of the file. If None, the locale encoding is used. (default: None)
+    chunk_size: int | None
+        Number of characters to read at once. Lines that are cut off at the end of a chunk are
+        completed with the next chunk. If None, the whole file is read at once. (default: None)
+
+    Yields
+    ------
+    list[str]
+        The complete lines of the current chunk.
+    """
+    with open(filepath, encoding=encoding) as text_file:
+        if chunk_size is None:
+            yield text_file.readlines()
+            return
+
+        remainder = ''
+        while chunk := text_file.read(chunk_size):
+            chunk = remainder + chunk
+            end_of_last_line = chunk.rfind('\n') + 1
+            remainder = chunk[end_of_last_line:]
+            yield io.StringIO(chunk[:end_of_last_line]).readlines()
+
+        if remainder:
+            yield [remainder]
+
+
 def _pre_process_metadata(metadata: defaultdict[str, Any]) -> dict[str, Any]:
     """Pre-process metadata to suitable types and formats.
 
@@ -302,6 +302,7 @@ def from_asc(
         encoding: str | None = None,
         definition: pm.DatasetDefinition | None = None,
         events: bool = False,
+        chunk_size: int | None = None,
 ) -> GazeDataFrame:
     """Initialize a :py:class:`pymovements.gaze.GazeDataFrame`.
 
@@ -338,6 +339,10 @@ def from_asc(
         (default: None)
     events: bool
         Flag indicating if events should be parsed from the asc file. (default: False)
+    chunk_size: int | None
+        If specified, the asc file is streamed in chunks of ``chunk_size`` characters instead of
+        being read into memory at once. This bounds the memory usage for parsing large files.
+        (default: None)
 
     Returns
     -------
@@ -408,6 +413,9 @@ def from_asc(
             if encoding is None and 'encoding' in custom_read_kwargs:
                 encoding = custom_read_kwargs['encoding']
 
+            if chunk_size is None and 'chunk_size' in custom_read_kwargs:
+                chunk_size = custom_read_kwargs['chunk_size']
+
     # Read data.
     gaze_data, event_data, metadata = parse_eyelink(
         file,
@@ -415,6 +423,7 @@ def from_asc(
         schema=schema,
         metadata_patterns=metadata_patterns,
         encoding=encoding,
+        chunk_size=chunk_size,
     )
 
     if add_columns is not None:
@@ -0,0 +1,80 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark EyeLink asc parsing throughput."""
+import pytest
+
+from pymovements.gaze._utils.parsing import parse_eyelink
+
+
+ASC_HEADER = """** DATE: Wed Mar  8 09:25:20 2023
+** VERSION: EYELINK II 1
+** EYELINK II CL v6.12 Feb  1 2018 (EyeLink Portable Duo)
+MSG\t1000 DISPLAY_COORDS 0 0 1279 1023
+MSG\t1000 RECCFG CR 1000 2 1 R
+MSG\t1000 ELCLCFG BTABLER
+MSG\t1000 GAZE_COORDS 0.00 0.00 1279.00 1023.00
+PUPIL\tAREA
+"""
+
+SAMPLES_PER_TRIAL = 1_000
+
+
+def write_asc_file(filepath, n_samples):
+    timestamp = 1001
+    with open(filepath, 'w', encoding='ascii') as asc_file:
+        asc_file.write(ASC_HEADER)
+
+        for trial_id in range(n_samples // SAMPLES_PER_TRIAL):
+            asc_file.write(f'MSG\t{timestamp} START_TRIAL_{trial_id}\n')
+            asc_file.write(f'START\t{timestamp} \tRIGHT\tSAMPLES\tEVENTS\n')
+            asc_file.write(f'SFIX\tR\t{timestamp}\n')
+            for _ in range(SAMPLES_PER_TRIAL):
+                asc_file.write(f'{timestamp}\t  850.7\t  717.5\t  714.0\t...\n')
+                timestamp += 1
+            asc_file.write(
+                f'EFIX\tR\t{timestamp - SAMPLES_PER_TRIAL}\t{timestamp - 1}\t{SAMPLES_PER_TRIAL}'
+                '\t850.7\t717.5\t714\n',
+            )
+            asc_file.write(f'END\t{timestamp} \tSAMPLES\tEVENTS\tRES\t  38.54\t  31.12\n')
+            asc_file.write(f'MSG\t{timestamp} STOP_TRIAL\n')
+
+
+@pytest.mark.parametrize('chunk_size', [None, 1 << 20], ids=['whole_file', 'chunked_1MiB'])
+@pytest.mark.parametrize('n_samples', [10_000, 100_000, 1_000_000])
+def test_parse_eyelink_throughput(benchmark, tmp_path, n_samples, chunk_size):
+    filepath = tmp_path / 'benchmark.asc'
+    write_asc_file(filepath, n_samples)
+
+    benchmark.pedantic(
+        parse_eyelink,
+        args=(filepath,),
+        kwargs={
+            'patterns': [
+                r'START_TRIAL_(?P<trial_id>\d+)',
+                {'pattern': 'STOP_TRIAL', 'column': 'trial_id', 'value': None},
+            ],
+            'chunk_size': chunk_size,
+        },
+        iterations=1, rounds=3,
+    )
+
+    file_size_mb = filepath.stat().st_size / 1_000_000
+    benchmark.extra_info['file_size_mb'] = file_size_mb
+    benchmark.extra_info['throughput_mb_per_s'] = file_size_mb / benchmark.stats.stats.mean
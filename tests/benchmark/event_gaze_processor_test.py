@@ -0,0 +1,90 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark event property computation."""
+import numpy as np
+import polars as pl
+import pytest
+
+import pymovements as pm
+
+
+SAMPLES_PER_EVENT = 10
+
+
+def generate_events_and_gaze(n_events, n_trials=10):
+    rng = np.random.default_rng(seed=42)
+    n_samples = n_events * SAMPLES_PER_EVENT
+    samples_per_trial = n_samples // n_trials
+    events_per_trial = n_events // n_trials
+
+    gaze = pm.GazeDataFrame(
+        pl.from_dict(
+            {
+                'trial': np.repeat(np.arange(n_trials), samples_per_trial),
+                'time': np.tile(np.arange(samples_per_trial), n_trials),
+                'x_pos': rng.normal(size=n_trials * samples_per_trial),
+                'y_pos': rng.normal(size=n_trials * samples_per_trial),
+                'x_vel': rng.normal(size=n_trials * samples_per_trial),
+                'y_vel': rng.normal(size=n_trials * samples_per_trial),
+            },
+        ),
+        position_columns=['x_pos', 'y_pos'],
+        velocity_columns=['x_vel', 'y_vel'],
+        trial_columns='trial',
+    )
+
+    onsets = np.arange(events_per_trial) * SAMPLES_PER_EVENT
+    events = pm.EventDataFrame(
+        pl.from_dict(
+            {
+                'trial': np.repeat(np.arange(n_trials), events_per_trial),
+                'name': 'fixation',
+                'onset': np.tile(onsets, n_trials),
+                'offset': np.tile(onsets + SAMPLES_PER_EVENT - 1, n_trials),
+            },
+        ),
+    )
+    return events, gaze
+
+
+@pytest.mark.parametrize(
+    ('engine', 'n_events'),
+    [
+        pytest.param('join', 1_000, id='join-1e3'),
+        pytest.param('join', 10_000, id='join-1e4'),
+        pytest.param('join', 100_000, id='join-1e5'),
+        pytest.param('loop', 1_000, id='loop-1e3'),
+        pytest.param('loop', 10_000, id='loop-1e4'),
+        pytest.param(
+            'loop', 100_000, id='loop-1e5',
+            marks=pytest.mark.skip(reason='the reference loop takes more than 20 minutes'),
+        ),
+    ],
+)
+def test_event_gaze_processor_process(benchmark, engine, n_events):
+    events, gaze = generate_events_and_gaze(n_events)
+    processor = pm.EventGazeProcessor(['amplitude', 'dispersion', 'location', 'peak_velocity'])
+
+    benchmark.pedantic(
+        processor.process,
+        args=(events, gaze),
+        kwargs={'identifiers': 'trial', 'engine': engine},
+        iterations=1, rounds=1 if engine == 'loop' else 5,
+    )
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test pymovements parallel utilities."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pymovements._utils._parallel import parallel_map
+
+
+def _square(value, delay=0.0):
+    time.sleep(delay)
+    return value ** 2
+
+
+def _fail_on_odd(value):
+    if value % 2:
+        raise ValueError(f'odd value {value}')
+    return value
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+@pytest.mark.parametrize('num_workers', [1, 2, 4])
+def test_parallel_map_preserves_order(num_workers, executor):
+    # Earlier items sleep longer so that they finish last.
+    kwargs_list = [{'value': value, 'delay': (8 - value) * 0.005} for value in range(8)]
+
+    results = parallel_map(
+        _square, kwargs_list, num_workers=num_workers, executor=executor,
+    )
+
+    assert results == [value ** 2 for value in range(8)]
+
+
+def test_parallel_map_empty():
+    assert not parallel_map(_square, [], num_workers=2)
+
+
+def test_parallel_map_serial_propagates_exception():
+    with pytest.raises(ValueError, match='odd value 1'):
+        parallel_map(_fail_on_odd, [{'value': 0}, {'value': 1}], num_workers=1)
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_parallel_map_reports_each_failed_item(executor):
+    kwargs_list = [{'value': value} for value in range(5)]
+    labels = [f'file_{value}.csv' for value in range(5)]
+
+    with pytest.raises(RuntimeError) as excinfo:
+        parallel_map(
+            _fail_on_odd, kwargs_list, num_workers=2, executor=executor, labels=labels,
+        )
+
+    message = str(excinfo.value)
+    assert message.startswith('2 of 5 items failed:')
+    assert 'file_1.csv: ValueError: odd value 1' in message
+    assert 'file_3.csv: ValueError: odd value 3' in message
+    assert 'file_0.csv' not in message
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'exception', 'message'),
+    [
+        pytest.param(
+            {'num_workers': 0},
+            ValueError,
+            'num_workers must be positive but is 0',
+            id='num_workers_zero',
+        ),
+        pytest.param(
+            {'num_workers': 1.5},
+            TypeError,
+            'num_workers must be of type int but is of type float',
+            id='num_workers_float',
+        ),
+        pytest.param(
+            {'num_workers': 2, 'executor': 'foo'},
+            ValueError,
+            "Executor 'foo' not supported",
+            id='unknown_executor',
+        ),
+    ],
+)
+def test_parallel_map_invalid_arguments_raise(kwargs, exception, message):
+    with pytest.raises(exception, match=message):
+        parallel_map(_square, [{'value': 1}], **kwargs)
@@ -600,6 +600,37 @@ def test_load_correct_event_dfs(gaze_dataset_configuration):
         assert_frame_equal(result_event_df.frame, expected_event_df)
 
 
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_load_parallel_equals_serial(gaze_dataset_configuration, executor):
+    serial_dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    serial_dataset.load(events=True)
+
+    parallel_dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    parallel_dataset.load(events=True, num_workers=2, executor=executor)
+
+    assert len(parallel_dataset.gaze) == len(serial_dataset.gaze)
+    for parallel_gaze, serial_gaze in zip(parallel_dataset.gaze, serial_dataset.gaze):
+        assert_frame_equal(parallel_gaze.frame, serial_gaze.frame)
+        assert parallel_gaze.trial_columns == serial_gaze.trial_columns
+        assert parallel_gaze.experiment == serial_gaze.experiment
+        assert_frame_equal(parallel_gaze.events.frame, serial_gaze.events.frame)
+
+
+@pytest.mark.parametrize(
+    'gaze_dataset_configuration',
+    ['ToyMono'],
+    indirect=['gaze_dataset_configuration'],
+)
+def test_load_parallel_missing_file_raises_runtime_error(gaze_dataset_configuration):
+    dataset = Dataset(**gaze_dataset_configuration['init_kwargs'])
+    dataset.scan()
+    missing_filepath = dataset.paths.raw / dataset.fileinfo['gaze']['filepath'][1]
+    missing_filepath.unlink()
+
+    with pytest.raises(RuntimeError, match=str(missing_filepath.name)):
+        dataset.load(num_workers=2)
+
+
 @pytest.mark.parametrize(
     ('subset', 'fileinfo_idx'),
     [
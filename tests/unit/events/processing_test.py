@@ -747,3 +747,91 @@ def test_event_processor_process_exceptions(
     msg, = excinfo.value.args
     for msg_substring in msg_substrings:
         assert msg_substring.lower() in msg.lower()
+
+
+@pytest.mark.parametrize(
+    'event_properties',
+    [
+        pytest.param('amplitude', id='amplitude'),
+        pytest.param('dispersion', id='dispersion'),
+        pytest.param('disposition', id='disposition'),
+        pytest.param('location', id='location_mean'),
+        pytest.param(('location', {'method': 'median'}), id='location_median'),
+        pytest.param('peak_velocity', id='peak_velocity'),
+        pytest.param(
+            ['amplitude', 'disposition', 'location', 'peak_velocity'],
+            id='multiple_properties',
+        ),
+    ],
+)
+@pytest.mark.parametrize(
+    'event_df',
+    [
+        pytest.param(
+            pl.from_dict(
+                {
+                    'subject_id': [1, 1, 2, 2],
+                    'name': ['A', 'B', 'A', 'B'],
+                    'onset': [0, 80, 10, 40],
+                    'offset': [10, 99, 30, 45],
+                },
+            ),
+            id='two_trials',
+        ),
+        pytest.param(
+            pl.from_dict(
+                {
+                    'subject_id': [2, 1, 1, 1],
+                    'name': ['A', 'saccade', 'fixation', 'blink'],
+                    'onset': [50, 20, 0, 25],
+                    'offset': [60, 40, 30, 27],
+                },
+            ),
+            id='overlapping_unsorted_events',
+        ),
+    ],
+)
+def test_event_gaze_processor_process_engines_have_equal_results(event_df, event_properties):
+    rng = np.random.default_rng(seed=42)
+    gaze = pm.GazeDataFrame(
+        pl.from_dict(
+            {
+                'subject_id': np.repeat([1, 2], 100),
+                'time': np.tile(np.arange(100), 2),
+                'x_pos': rng.normal(size=200),
+                'y_pos': rng.normal(size=200),
+                'x_vel': rng.normal(size=200),
+                'y_vel': rng.normal(size=200),
+            },
+        ),
+        position_columns=['x_pos', 'y_pos'],
+        velocity_columns=['x_vel', 'y_vel'],
+    )
+    events = pm.EventDataFrame(event_df)
+    processor = pm.EventGazeProcessor(event_properties)
+
+    loop_result = processor.process(events, gaze, identifiers='subject_id', engine='loop')
+    join_result = processor.process(events, gaze, identifiers='subject_id', engine='join')
+
+    assert_frame_equal(join_result, loop_result)
+
+
+def test_event_gaze_processor_process_unsupported_engine_raises_value_error():
+    events = pm.EventDataFrame(
+        pl.from_dict({'subject_id': [1], 'onset': [0], 'offset': [10]}),
+    )
+    gaze = pm.GazeDataFrame(
+        pl.from_dict(
+            {
+                'subject_id': np.ones(10, dtype=int),
+                'time': np.arange(10),
+                'x_vel': np.ones(10),
+                'y_vel': np.zeros(10),
+            },
+        ),
+        velocity_columns=['x_vel', 'y_vel'],
+    )
+    processor = pm.EventGazeProcessor('peak_velocity')
+
+    with pytest.raises(ValueError, match="Engine 'foo' not supported"):
+        processor.process(events, gaze, identifiers='subject_id', engine='foo')
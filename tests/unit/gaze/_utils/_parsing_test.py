@@ -229,6 +229,75 @@ def test_parse_eyelink(tmp_path):
     assert metadata == EXPECTED_METADATA
 
 
+@pytest.mark.parametrize('chunk_size', [1, 7, 64, 1024, 1_000_000])
+def test_parse_eyelink_chunked(tmp_path, chunk_size):
+    filepath = tmp_path / 'sub.asc'
+    filepath.write_text(ASC_TEXT)
+
+    gaze_df, event_df, metadata = pm.gaze._utils.parsing.parse_eyelink(
+        filepath,
+        patterns=PATTERNS,
+        metadata_patterns=METADATA_PATTERNS,
+        chunk_size=chunk_size,
+    )
+
+    assert_frame_equal(gaze_df, EXPECTED_GAZE_DF, check_column_order=False, rtol=0)
+    assert_frame_equal(event_df, EXPECTED_EVENT_DF, check_column_order=False, rtol=0)
+    assert metadata == EXPECTED_METADATA
+
+
+@pytest.mark.filterwarnings('ignore:No metadata found.')
+@pytest.mark.filterwarnings('ignore:No recording configuration found.')
+def test_parse_eyelink_sample_blocks_skip_unmatched_lines(tmp_path):
+    filepath = tmp_path / 'sub.asc'
+    filepath.write_text(
+        '10000000\t  850.7\t  717.5\t  714.0\t    0.0\t...\n'
+        '10000001\t  850.7\t  717.5\t  714\t    0.0\t...\n'  # pupil without decimal point
+        '10000002\t   .\t   -.\t    0.0\t    0.0\t...\n'
+        'MSG 10000003 START_A\n'
+        '10000003.5\t  -1.5\t  .5\t  1.\n',
+    )
+
+    gaze_df, _, metadata = pm.gaze._utils.parsing.parse_eyelink(
+        filepath, patterns=[{'pattern': 'START_A', 'column': 'task', 'value': 'A'}],
+    )
+
+    expected_gaze_df = pl.from_dict(
+        {
+            'time': [10000000.0, 10000002.0, 10000003.5],
+            'x_pix': [850.7, np.nan, -1.5],
+            'y_pix': [717.5, np.nan, 0.5],
+            'pupil': [714.0, 0.0, 1.0],
+            'task': [None, None, 'A'],
+        },
+    )
+    assert_frame_equal(gaze_df, expected_gaze_df, check_column_order=False, rtol=0)
+    assert metadata['data_loss_ratio'] == 0.0
+
+
+@pytest.mark.parametrize(
+    'filepath',
+    [
+        'tests/files/eyelink_monocular_example.asc',
+        'tests/files/eyelink_monocular_2khz_example.asc',
+        'tests/files/eyelink_monocular_no_dummy_example.asc',
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [100, 4096])
+def test_parse_eyelink_chunked_equals_unchunked(filepath, chunk_size):
+    expected_gaze_df, expected_event_df, expected_metadata = (
+        pm.gaze._utils.parsing.parse_eyelink(filepath)
+    )
+
+    gaze_df, event_df, metadata = pm.gaze._utils.parsing.parse_eyelink(
+        filepath, chunk_size=chunk_size,
+    )
+
+    assert_frame_equal(gaze_df, expected_gaze_df, rtol=0)
+    assert_frame_equal(event_df, expected_event_df, rtol=0)
+    assert metadata == expected_metadata
+
+
 @pytest.mark.parametrize(
     ('kwargs', 'expected_metadata'),
     [
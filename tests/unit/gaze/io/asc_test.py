@@ -211,6 +211,17 @@ def test_from_asc_has_frame_equal(kwargs, expected_frame):
     assert_frame_equal(gaze.frame, expected_frame, check_column_order=False)
 
 
+@pytest.mark.parametrize('chunk_size', [256, 4096])
+def test_from_asc_chunked_has_frame_equal(chunk_size):
+    expected_gaze = from_asc('tests/files/eyelink_monocular_example.asc', events=True)
+    gaze = from_asc(
+        'tests/files/eyelink_monocular_example.asc', events=True, chunk_size=chunk_size,
+    )
+
+    assert_frame_equal(gaze.frame, expected_gaze.frame)
+    assert_frame_equal(gaze.events.frame, expected_gaze.events.frame)
+
+
 @pytest.mark.parametrize(
     ('kwargs', 'shape', 'schema'),
     [